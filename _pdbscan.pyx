@@ -0,0 +1,77 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""Optional compiled page scans for validate.py.
+
+Build in place with:
+
+    python setup_pdbscan.py build_ext --inplace
+
+validate.py falls back to NumPy (or pure Python) when the extension is
+not built.
+"""
+
+import numpy as np
+
+
+cpdef tuple validate_core(const unsigned char[::1] buf, Py_ssize_t num_pages):
+    """Run the whole per-page validation in one fused compiled pass.
+
+    For every page this inlines the zero scan, the flags/row-count parse
+    and the row-group presence/pad compare, returning (errors, warnings)
+    lists with the same messages validate.py produces. One pass over the
+    file replaces the separate Python-level scans.
+    """
+    errors = []
+    warnings = []
+    cdef Py_ssize_t page_num, base, k, g, group_start, num_groups
+    cdef unsigned long long acc
+    cdef unsigned int packed, num_rows, num_offsets, presence, pad
+    cdef double ratio
+    for page_num in range(1, num_pages):
+        base = page_num * 4096
+        acc = 0
+        for k in range(4096):
+            acc |= buf[base + k]
+        if acc == 0:
+            continue
+        if buf[base + 0x1B] & 0x40:
+            continue
+        packed = buf[base + 0x18] | (buf[base + 0x19] << 8) | (buf[base + 0x1A] << 16)
+        num_rows = packed & 0x7FF
+        num_offsets = packed >> 11
+        if num_rows > 0:
+            ratio = (<double>num_offsets) / (<double>num_rows)
+            if ratio != 4.0:
+                warnings.append(f"Page {page_num}: offset ratio {ratio:.1f} (expected 4.0)")
+        num_groups = (num_rows + 15) // 16 if num_rows > 0 else 1
+        if num_groups * 36 > 4096:
+            # The group records cannot fit in the page; reading them would
+            # run into the preceding page, so report the bogus count instead.
+            errors.append(f"Page {page_num}: row count {num_rows} overflows the row-group area")
+            continue
+        for g in range(num_groups):
+            group_start = base + 4096 - (g + 1) * 36
+            presence = buf[group_start + 32] | (buf[group_start + 33] << 8)
+            pad = buf[group_start + 34] | (buf[group_start + 35] << 8)
+            if presence != pad:
+                errors.append(f"Page {page_num} group {g}: presence ({presence:#x}) != pad ({pad:#x})")
+    return errors, warnings
+
+
+cpdef object nonzero_pages(const unsigned char[::1] buf, Py_ssize_t page_size):
+    """Return a uint8 array with 1 for every page containing a non-zero byte.
+
+    The inner OR loop compiles to a handful of SIMD loads per 4 KiB page,
+    so the scan runs at memory bandwidth.
+    """
+    cdef Py_ssize_t n = buf.shape[0] // page_size
+    out = np.empty(n, dtype=np.uint8)
+    cdef unsigned char[::1] out_view = out
+    cdef Py_ssize_t i, j, base
+    cdef unsigned char acc
+    for i in range(n):
+        acc = 0
+        base = i * page_size
+        for j in range(page_size):
+            acc |= buf[base + j]
+        out_view[i] = acc != 0
+    return out
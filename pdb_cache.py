@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""Shared cache of parsed export.pdb header data.
+
+validate.py and verify_usb_export.py both parse the same PDB header and
+table list when run back to back. Entries are keyed by the file's
+(mtime, size), so a cache hit skips the re-parse entirely while any
+modification to the PDB invalidates it. The cache lives in
+~/.cache/rekord-export/pdb.json; reads within one process are memoized
+with lru_cache so repeated lookups do not even re-stat the cache file.
+"""
+
+import json
+import os
+from functools import lru_cache
+
+_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'rekord-export')
+_CACHE_FILE = os.path.join(_CACHE_DIR, 'pdb.json')
+
+def _stat_key(path):
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
+@lru_cache(maxsize=16)
+def _load_entry(abspath, mtime_ns, size):
+    try:
+        with open(_CACHE_FILE) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return None
+    entry = cache.get(abspath)
+    if isinstance(entry, dict) and entry.get('mtime_ns') == mtime_ns and entry.get('size') == size:
+        return entry
+    return None
+
+def get(path):
+    """Return the cached header entry for path, or None if absent or stale."""
+    abspath = os.path.abspath(path)
+    try:
+        mtime_ns, size = _stat_key(abspath)
+    except OSError:
+        return None
+    return _load_entry(abspath, mtime_ns, size)
+
+def put(path, entry):
+    """Store header data for path, keyed by its current (mtime, size).
+
+    Failures to write are silent: the cache is purely an optimization and
+    must never break validation on a read-only home directory.
+    """
+    abspath = os.path.abspath(path)
+    try:
+        mtime_ns, size = _stat_key(abspath)
+    except OSError:
+        return
+    try:
+        with open(_CACHE_FILE) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        cache = {}
+    stored = dict(entry)
+    stored['mtime_ns'] = mtime_ns
+    stored['size'] = size
+    cache[abspath] = stored
+    try:
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+        tmp = _CACHE_FILE + '.tmp'
+        with open(tmp, 'w') as f:
+            json.dump(cache, f)
+        os.replace(tmp, _CACHE_FILE)
+    except OSError:
+        return
+    _load_entry.cache_clear()
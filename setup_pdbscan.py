@@ -0,0 +1,22 @@
+#!/usr/bin/env python3
+"""Build the optional _pdbscan Cython extension used by validate.py.
+
+Usage:
+    python setup_pdbscan.py build_ext --inplace
+"""
+
+import numpy as np
+from setuptools import Extension, setup
+from Cython.Build import cythonize
+
+setup(
+    name='pdbscan',
+    ext_modules=cythonize([
+        Extension(
+            '_pdbscan',
+            ['_pdbscan.pyx'],
+            include_dirs=[np.get_include()],
+            extra_compile_args=['-O3', '-march=native'],
+        ),
+    ]),
+)
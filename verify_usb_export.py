@@ -1,9 +1,66 @@
 #!/usr/bin/env python3
 """Complete rekordbox USB export analyzer"""
+import mmap
+from concurrent.futures import ThreadPoolExecutor
 import struct
 import sys
 import os
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+try:
+    import pdb_cache
+except ImportError:
+    pdb_cache = None
+
+# Pre-compiled struct formats; parsing the format string once beats
+# re-parsing it on every unpack call in the parse loops.
+_U_LE_U32 = struct.Struct('<I')
+_HDR_4U32 = struct.Struct('<IIII')
+_HDR_3U32 = struct.Struct('<III')
+
+def _tag(s):
+    """Pack a four-character ANLZ tag into its big-endian u32 value."""
+    return int.from_bytes(s.encode('ascii'), 'big')
+
+# ANLZ tags as u32 constants: one integer compare per section instead of
+# a bytes->str decode plus string equality.
+_TAG_PMAI = _tag("PMAI")
+_TAG_PPTH = _tag("PPTH")
+_TAG_PQTZ = _tag("PQTZ")
+_TAG_PWAV = _tag("PWAV")
+_TAG_PWV3 = _tag("PWV3")
+_TAG_PWV4 = _tag("PWV4")
+_TAG_PWV5 = _tag("PWV5")
+_TAG_PCOB = _tag("PCOB")
+_TAG_PCO2 = _tag("PCO2")
+
+if np is not None:
+    # Structured views of the PDB file header and table-list records: one
+    # buffer view replaces num_tables + 1 Python-level unpacks.
+    _PDB_HEADER_DTYPE = np.dtype([
+        ('unknown1', '<u4'), ('page_size', '<u4'), ('num_tables', '<u4'),
+        ('next_unused', '<u4'), ('unknown2', '<u4'), ('sequence', '<u4'),
+        ('unknown3', '<u4'),
+    ])
+    _PDB_TABLE_DTYPE = np.dtype([
+        ('type', '<u4'), ('empty_candidate', '<u4'),
+        ('first_page', '<u4'), ('last_page', '<u4'),
+    ])
+
+# djprofile.nxs header padding (everything before the profile name at 0x20).
+# Comparing against a zero constant is a single memcmp, the same idiom
+# validate.py uses for empty pages.
+_Z32 = bytes(0x20)
+
 def analyze_devsetting(filepath):
     """Analyze DEVSETTING.DAT"""
     print(f"\n{'='*60}")
@@ -20,12 +77,13 @@ def analyze_devsetting(filepath):
         return False
     
     # Parse fields
-    size = struct.unpack('<I', data[0:4])[0]
+    mv = memoryview(data)
+    size = int.from_bytes(mv[0:4], 'little')
     brand = data[4:32].rstrip(b'\x00').decode('ascii', errors='replace')
     app = data[36:68].rstrip(b'\x00').decode('ascii', errors='replace')
     version = data[68:100].rstrip(b'\x00').decode('ascii', errors='replace')
-    marker = struct.unpack('<I', data[100:104])[0]
-    magic = struct.unpack('<I', data[104:108])[0]
+    marker = int.from_bytes(mv[100:104], 'little')
+    magic = int.from_bytes(mv[104:108], 'little')
     
     print(f"  Size header: 0x{size:X} (expected 0x60)")
     print(f"  Brand: '{brand}' (expected 'PIONEER DJ')")
@@ -59,27 +117,94 @@ def analyze_djprofile(filepath):
     print(f"  DJ Profile name: '{name}'")
     
     # Check padding
-    padding_ok = all(b == 0 for b in data[0:0x20]) and all(b == 0 for b in data[0x40:])
+    padding_ok = data[0:0x20] == _Z32 and data[0x40:] == bytes(len(data) - 0x40)
     print(f"  Padding: {'✅ OK' if padding_ok else '⚠️ Non-zero padding'}")
     
     print(f"\n✅ VALID")
     return True
 
+def _page_row_counts(data, file_size):
+    """Extract the row count of every page in one vectorized pass.
+
+    Returns an array indexed by page number (the header page forced to 0),
+    or None without NumPy. Computing this once lets each table's total
+    become a plain slice-and-sum instead of one unpack per page.
+    """
+    if np is None:
+        return None
+    num_pages = file_size // 4096
+    words = np.frombuffer(data, dtype=np.uint8)[:num_pages * 4096]
+    words = words.reshape(-1, 4096)[:, 24:28].astype(np.uint32)
+    row_data = words[:, 0] | (words[:, 1] << 8) | (words[:, 2] << 16) | (words[:, 3] << 24)
+    counts = (row_data >> 13) & 0x7FF
+    if counts.size:
+        counts[0] = 0  # header page holds no rows
+    # A trailing partial page still has a readable row word as long as its
+    # header made it to disk; the unpack-per-page fallback counts it, so
+    # this tier must agree or chunk0-18's cache would persist whichever
+    # tier happened to run first.
+    if num_pages * 4096 + 28 <= file_size:
+        if num_pages == 0:
+            partial = 0  # the header page holds no rows
+        else:
+            word = int.from_bytes(data[num_pages * 4096 + 24:num_pages * 4096 + 28], 'little')
+            partial = (word >> 13) & 0x7FF
+        counts = np.append(counts, np.uint32(partial))
+    return counts
+
+def _count_table_rows(data, file_size, first_page, last_page, page_rows=None):
+    """Sum the row counts of every page in a table's page range."""
+    if page_rows is not None:
+        lo = max(first_page, 1)
+        hi = min(last_page, len(page_rows) - 1)
+        if hi < lo:
+            return 0
+        return int(page_rows[lo:hi + 1].sum())
+
+    total_rows = 0
+    for page_num in range(first_page, last_page + 1):
+        if page_num == 0 or page_num * 4096 + 28 > file_size:
+            continue
+        row_data = _U_LE_U32.unpack_from(data, page_num * 4096 + 24)[0]
+        total_rows += (row_data >> 13) & 0x7FF
+    return total_rows
+
 def analyze_pdb(filepath):
     """Analyze export.pdb"""
+    fd = open(filepath, 'rb')
+    try:
+        data = mmap.mmap(fd.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            return _analyze_pdb(filepath, fd, data)
+        finally:
+            try:
+                data.close()
+            except BufferError:
+                # A propagating traceback can still hold views of the map;
+                # let the real error surface and leave the map to the GC.
+                pass
+    finally:
+        fd.close()
+
+def _analyze_pdb(filepath, fd, data):
     print(f"\n{'='*60}")
     print(f"export.pdb Analysis")
     print(f"{'='*60}")
-    
-    with open(filepath, 'rb') as f:
-        data = f.read()
-    
-    print(f"File size: {len(data)} bytes ({len(data)//4096} pages)")
-    
+
+    file_size = os.fstat(fd.fileno()).st_size
+    print(f"File size: {file_size} bytes ({file_size//4096} pages)")
+
     # File header
-    unknown1, page_size, num_tables, next_unused = struct.unpack_from('<IIII', data, 0)
-    unknown2, sequence, unknown3 = struct.unpack_from('<III', data, 16)
-    
+    if np is not None:
+        hdr = np.frombuffer(data, dtype=_PDB_HEADER_DTYPE, count=1)[0]
+        page_size = int(hdr['page_size'])
+        num_tables = int(hdr['num_tables'])
+        next_unused = int(hdr['next_unused'])
+        sequence = int(hdr['sequence'])
+    else:
+        unknown1, page_size, num_tables, next_unused = _HDR_4U32.unpack_from(data, 0)
+        unknown2, sequence, unknown3 = _HDR_3U32.unpack_from(data, 16)
+
     print(f"\nHeader:")
     print(f"  Page size: {page_size} {'✅' if page_size == 4096 else '❌'}")
     print(f"  Number of tables: {num_tables}")
@@ -97,26 +222,47 @@ def analyze_pdb(filepath):
     found_tables = set()
     
     print(f"\nTables:")
-    offset = 28
-    for i in range(num_tables):
-        if offset + 16 > len(data):
-            break
-        table_type, empty_candidate, first_page, last_page = struct.unpack_from('<IIII', data, offset)
+
+    # Reuse row totals computed by a previous run on the unchanged file;
+    # counting rows is the expensive part of this analysis.
+    cached = pdb_cache.get(filepath) if pdb_cache is not None else None
+    cached_rows = cached.get('table_rows') if cached is not None else None
+    page_rows = _page_row_counts(data, file_size) if cached_rows is None else None
+
+    # Read the whole table list up front - a structured view when NumPy
+    # is available, one record unpack at a time otherwise.
+    max_tables = min(num_tables, max((file_size - 28) // 16, 0))
+    if np is not None:
+        recs = np.frombuffer(data, dtype=_PDB_TABLE_DTYPE, count=max_tables, offset=28)
+        table_list = [(int(r['type']), int(r['first_page']), int(r['last_page'])) for r in recs]
+    else:
+        table_list = [
+            (rec[0], rec[2], rec[3])
+            for rec in (_HDR_4U32.unpack_from(data, 28 + 16 * i) for i in range(max_tables))
+        ]
+
+    table_rows = []
+    for i, (table_type, first_page, last_page) in enumerate(table_list):
         name = table_names.get(table_type, f"Unknown{table_type}")
         found_tables.add(table_type)
-        
+
         # Count rows in this table
-        total_rows = 0
-        for page_num in range(first_page, last_page + 1):
-            if page_num == 0 or page_num * 4096 + 28 > len(data):
-                continue
-            page_offset = page_num * 4096
-            row_data = struct.unpack_from('<I', data, page_offset + 24)[0]
-            num_rows = (row_data >> 13) & 0x7FF
-            total_rows += num_rows
-        
+        if cached_rows is not None and i < len(cached_rows):
+            total_rows = cached_rows[i]
+        else:
+            total_rows = _count_table_rows(data, file_size, first_page, last_page, page_rows)
+        table_rows.append(total_rows)
+
         print(f"  Type {table_type:2d} ({name:16s}): pages {first_page}-{last_page}, ~{total_rows} rows")
-        offset += 16
+
+    # Key the write-back on the row totals being absent: a header-only
+    # entry from validate.py must not stop them from ever being cached.
+    if cached_rows is None and pdb_cache is not None:
+        pdb_cache.put(filepath, {
+            'page_size': page_size,
+            'num_tables': num_tables,
+            'table_rows': table_rows,
+        })
     
     # Check required tables
     missing = required_tables - found_tables
@@ -127,85 +273,195 @@ def analyze_pdb(filepath):
     print(f"\n✅ All required tables present")
     return True
 
+def _decode_ppth(raw):
+    """Decode a PPTH UTF-16-BE path, fast-pathing the pure-ASCII case.
+
+    rekordbox paths are mostly Latin text, which in UTF-16-BE means every
+    high byte is zero. One memcmp of the high bytes against a zero
+    constant confirms that, and the low bytes then decode as latin-1 -
+    exactly equivalent to UTF-16-BE for code points up to U+00FF, so
+    accented characters survive - without running the UTF-16 decoder.
+    """
+    raw = bytes(raw)
+    if raw[0::2] == bytes(len(raw) // 2):
+        return raw[1::2].decode('latin-1')
+    return raw.decode('utf-16-be')
+
+def _scan_anlz_py(buf, start, end):
+    """Enumerate ANLZ sections, returning parallel (tags, offsets, lengths) lists.
+
+    Tags come back as big-endian u32s so the scan allocates no per-section
+    strings; callers decode only for display.
+    """
+    tags, offsets, lengths = [], [], []
+    from_bytes = int.from_bytes
+    add_tag, add_offset, add_length = tags.append, offsets.append, lengths.append
+    offset = start
+    while offset < end - 12:
+        tag_u32 = from_bytes(buf[offset:offset + 4], 'big')
+        if (tag_u32 >> 24) == 0:
+            break
+        section_len = from_bytes(buf[offset + 8:offset + 12], 'big')
+        if section_len == 0 or offset + section_len > end:
+            break
+        add_tag(tag_u32)
+        add_offset(offset)
+        add_length(section_len)
+        offset += section_len
+    return tags, offsets, lengths
+
+if njit is not None and np is not None:
+    # LLVM-compiled section scan: native byte loads and endian swaps in a
+    # tight loop instead of interpreted int.from_bytes per field.
+    @njit(cache=True)
+    def _scan_anlz_jit(buf, start):
+        n = buf.shape[0]
+        cap = 64
+        tags = np.empty(cap, np.uint32)
+        offsets = np.empty(cap, np.int64)
+        lengths = np.empty(cap, np.int64)
+        count = 0
+        offset = start
+        while offset < n - 12:
+            if buf[offset] == 0:
+                break
+            tag_u32 = ((np.uint32(buf[offset]) << 24) | (np.uint32(buf[offset + 1]) << 16)
+                       | (np.uint32(buf[offset + 2]) << 8) | np.uint32(buf[offset + 3]))
+            section_len = ((np.int64(buf[offset + 8]) << 24) | (np.int64(buf[offset + 9]) << 16)
+                           | (np.int64(buf[offset + 10]) << 8) | np.int64(buf[offset + 11]))
+            if section_len == 0 or offset + section_len > n:
+                break
+            if count == cap:
+                cap *= 2
+                new_tags = np.empty(cap, np.uint32)
+                new_offsets = np.empty(cap, np.int64)
+                new_lengths = np.empty(cap, np.int64)
+                new_tags[:count] = tags
+                new_offsets[:count] = offsets
+                new_lengths[:count] = lengths
+                tags, offsets, lengths = new_tags, new_offsets, new_lengths
+            tags[count] = tag_u32
+            offsets[count] = offset
+            lengths[count] = section_len
+            count += 1
+            offset += section_len
+        return tags[:count], offsets[:count], lengths[:count]
+else:
+    _scan_anlz_jit = None
+
+def _enumerate_sections(data, start, end):
+    """Collect every section's (tag, offset, length) before any formatting.
+
+    Separating the memory-bound scan from the per-section dispatch lets the
+    scan run as one tight counted pass (JIT-compiled when available) and
+    keeps the dispatch loop a simple iteration over precomputed arrays.
+    """
+    if _scan_anlz_jit is not None:
+        return _scan_anlz_jit(np.frombuffer(data, dtype=np.uint8), start)
+    return _scan_anlz_py(data, start, end)
+
+# Refuse to map absurdly large ANLZ files; a corrupt export should not
+# drive a multi-gigabyte mapping.
+_MAX_ANLZ_SIZE = 512 * 1024 * 1024
+
 def analyze_anlz(filepath):
-    """Analyze ANLZ file (.DAT, .EXT, or .2EX)"""
+    """Analyze ANLZ file (.DAT, .EXT, or .2EX).
+
+    Returns (ok, report): the report is built as text rather than printed
+    so that several files can be analyzed concurrently without
+    interleaving their output.
+    """
+    out = []
     filename = os.path.basename(filepath)
-    print(f"\n{'='*60}")
-    print(f"{filename} Analysis")
-    print(f"{'='*60}")
-    
-    with open(filepath, 'rb') as f:
-        data = f.read()
-    
-    print(f"File size: {len(data)} bytes")
-    
-    if len(data) < 28:
-        print("❌ ERROR: File too small!")
-        return False
-    
+    out.append(f"\n{'='*60}")
+    out.append(f"{filename} Analysis")
+    out.append(f"{'='*60}")
+
+    file_size = os.path.getsize(filepath)
+    out.append(f"File size: {file_size} bytes")
+
+    if file_size < 28:
+        out.append("❌ ERROR: File too small!")
+        return False, '\n'.join(out)
+
+    if file_size > _MAX_ANLZ_SIZE:
+        out.append(f"❌ ERROR: File too large ({file_size} bytes)!")
+        return False, '\n'.join(out)
+
+    fd = open(filepath, 'rb')
+    try:
+        data = mmap.mmap(fd.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            ok = _analyze_anlz(filepath, data, out)
+        finally:
+            try:
+                data.close()
+            except BufferError:
+                # A propagating traceback can still hold views of the map;
+                # let the real error surface and leave the map to the GC.
+                pass
+    finally:
+        fd.close()
+    return ok, '\n'.join(out)
+
+def _analyze_anlz(filepath, data, out):
     # PMAI header
-    tag = data[0:4].decode('ascii', errors='replace')
-    if tag != "PMAI":
-        print(f"❌ ERROR: Invalid header tag '{tag}' (expected 'PMAI')")
+    if int.from_bytes(data[0:4], 'big') != _TAG_PMAI:
+        tag = data[0:4].decode('ascii', errors='replace')
+        out.append(f"❌ ERROR: Invalid header tag '{tag}' (expected 'PMAI')")
         return False
     
-    header_len = struct.unpack('>I', data[4:8])[0]
-    total_len = struct.unpack('>I', data[8:12])[0]
+    mv = memoryview(data)
+    header_len = int.from_bytes(mv[4:8], 'big')
+    total_len = int.from_bytes(mv[8:12], 'big')
     
-    print(f"  PMAI header_len={header_len}, declared_size={total_len}")
+    out.append(f"  PMAI header_len={header_len}, declared_size={total_len}")
     if total_len != len(data):
-        print(f"  ⚠️ Size mismatch: declared {total_len} vs actual {len(data)}")
+        out.append(f"  ⚠️ Size mismatch: declared {total_len} vs actual {len(data)}")
     
-    # Parse sections
+    # Scan the tagged-section list first, then do only dispatch and
+    # formatting at Python level.
+    tags, offsets, lengths = _enumerate_sections(data, 4 + header_len, len(data))
+
     sections = {}
-    offset = 4 + header_len  # Skip PMAI header
-    
-    while offset < len(data) - 12:
-        tag = data[offset:offset+4]
-        if tag[0] == 0:
-            break
-        tag_str = tag.decode('ascii', errors='replace')
-        
-        header_len = struct.unpack('>I', data[offset+4:offset+8])[0]
-        section_len = struct.unpack('>I', data[offset+8:offset+12])[0]
-        
-        if section_len == 0 or offset + section_len > len(data):
-            break
-        
+    for i in range(len(tags)):
+        tag_u32 = int(tags[i])
+        offset = int(offsets[i])
+        section_len = int(lengths[i])
         info = ""
-        if tag_str == "PPTH":
-            path_len = struct.unpack('>I', data[offset+12:offset+16])[0]
+        if tag_u32 == _TAG_PPTH:
+            path_len = int.from_bytes(mv[offset + 12:offset + 16], 'big')
             try:
-                path = data[offset+16:offset+16+path_len*2].decode('utf-16-be')
+                path = _decode_ppth(data[offset + 16:offset + 16 + path_len * 2])
                 info = f"path='{path[:40]}{'...' if len(path)>40 else ''}'"
             except:
                 info = f"path_len={path_len}"
-        elif tag_str == "PQTZ":
-            beat_count = struct.unpack('>I', data[offset+20:offset+24])[0]
+        elif tag_u32 == _TAG_PQTZ:
+            beat_count = int.from_bytes(mv[offset + 20:offset + 24], 'big')
             info = f"beats={beat_count}"
-        elif tag_str == "PWAV":
-            entry_count = struct.unpack('>I', data[offset+12:offset+16])[0]
+        elif tag_u32 == _TAG_PWAV:
+            entry_count = int.from_bytes(mv[offset + 12:offset + 16], 'big')
             info = f"entries={entry_count} {'✅' if entry_count == 400 else '⚠️'}"
-        elif tag_str == "PWV3":
-            entry_count = struct.unpack('>I', data[offset+12:offset+16])[0]
+        elif tag_u32 == _TAG_PWV3:
+            entry_count = int.from_bytes(mv[offset + 12:offset + 16], 'big')
             info = f"entries={entry_count}"
-        elif tag_str == "PWV4":
-            entry_count = struct.unpack('>I', data[offset+12:offset+16])[0]
+        elif tag_u32 == _TAG_PWV4:
+            entry_count = int.from_bytes(mv[offset + 12:offset + 16], 'big')
             expected_size = 20 + 1200 * 6
             info = f"entries={entry_count} {'✅' if entry_count == 1200 else '⚠️'}"
-        elif tag_str == "PWV5":
-            entry_count = struct.unpack('>I', data[offset+12:offset+16])[0]
+        elif tag_u32 == _TAG_PWV5:
+            entry_count = int.from_bytes(mv[offset + 12:offset + 16], 'big')
             info = f"entries={entry_count}"
-        elif tag_str in ("PCOB", "PCO2"):
-            cue_type = struct.unpack('>I', data[offset+12:offset+16])[0]
-            cue_count = struct.unpack('>H', data[offset+18:offset+20])[0]
+        elif tag_u32 in (_TAG_PCOB, _TAG_PCO2):
+            cue_type = int.from_bytes(mv[offset + 12:offset + 16], 'big')
+            cue_count = int.from_bytes(mv[offset + 18:offset + 20], 'big')
             info = f"type={'hot' if cue_type else 'memory'}, count={cue_count}"
         
+        # Decode to str only once per section, for reporting
+        tag_str = tag_u32.to_bytes(4, 'big').decode('ascii', errors='replace')
         sections[tag_str] = section_len
-        print(f"  {tag_str}: size={section_len:6d} {info}")
-        
-        offset += section_len
-    
+        out.append(f"  {tag_str}: size={section_len:6d} {info}")
+
     # Check required sections based on file type
     ext = os.path.splitext(filepath)[1].upper()
     if ext == ".DAT":
@@ -215,12 +471,35 @@ def analyze_anlz(filepath):
     
     missing = required - set(sections.keys())
     if missing:
-        print(f"\n❌ Missing sections: {missing}")
+        out.append(f"\n❌ Missing sections: {missing}")
         return False
-    
-    print(f"\n✅ All required sections present")
+
+    out.append(f"\n✅ All required sections present")
     return True
 
+def _scan_tree(root):
+    """Walk root once with os.scandir, returning {relative path: DirEntry}.
+
+    DirEntry carries the file type from the directory read itself, so the
+    existence and is-file checks made against the returned dict cost no
+    further syscalls - on slow USB media every avoided stat() is a saved
+    round-trip.
+    """
+    tree = {}
+    stack = ['']
+    while stack:
+        rel = stack.pop()
+        try:
+            with os.scandir(os.path.join(root, rel)) as it:
+                for entry in it:
+                    entry_rel = f"{rel}/{entry.name}" if rel else entry.name
+                    tree[entry_rel] = entry
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry_rel)
+        except OSError:
+            pass
+    return tree
+
 def main():
     usb_root = sys.argv[1] if len(sys.argv) > 1 else "example-USB"
     
@@ -230,7 +509,11 @@ def main():
     print(f"Analyzing: {usb_root}")
     
     results = {}
-    
+
+    # One scandir pass over the whole export; all later existence checks
+    # hit this dict instead of the filesystem.
+    tree = _scan_tree(usb_root)
+
     # Check directory structure
     print(f"\n{'='*60}")
     print("Directory Structure Check")
@@ -245,31 +528,33 @@ def main():
     ]
     
     for path in required_paths:
-        full = os.path.join(usb_root, path)
-        exists = os.path.exists(full)
+        exists = path in tree
         print(f"  {path}: {'✅' if exists else '❌'}")
-    
+
     # Analyze individual files
-    devsetting = os.path.join(usb_root, "PIONEER/DEVSETTING.DAT")
-    if os.path.exists(devsetting):
-        results['DEVSETTING'] = analyze_devsetting(devsetting)
-    
-    djprofile = os.path.join(usb_root, "PIONEER/djprofile.nxs")
-    if os.path.exists(djprofile):
-        results['djprofile'] = analyze_djprofile(djprofile)
-    
-    pdb = os.path.join(usb_root, "PIONEER/rekordbox/export.pdb")
-    if os.path.exists(pdb):
-        results['export.pdb'] = analyze_pdb(pdb)
-    
-    # Find and analyze ANLZ files
-    anlz_dir = os.path.join(usb_root, "PIONEER/USBANLZ")
-    if os.path.exists(anlz_dir):
-        for root, dirs, files in os.walk(anlz_dir):
-            for f in files:
-                if f.endswith(('.DAT', '.EXT', '.2EX')):
-                    path = os.path.join(root, f)
-                    results[f] = analyze_anlz(path)
+    if "PIONEER/DEVSETTING.DAT" in tree:
+        results['DEVSETTING'] = analyze_devsetting(os.path.join(usb_root, "PIONEER/DEVSETTING.DAT"))
+
+    if "PIONEER/djprofile.nxs" in tree:
+        results['djprofile'] = analyze_djprofile(os.path.join(usb_root, "PIONEER/djprofile.nxs"))
+
+    if "PIONEER/rekordbox/export.pdb" in tree:
+        results['export.pdb'] = analyze_pdb(os.path.join(usb_root, "PIONEER/rekordbox/export.pdb"))
+
+    # Find and analyze ANLZ files concurrently; each analysis is
+    # independent, so threads overlap the per-file read latency. Reports
+    # are printed in discovery order to keep output deterministic.
+    anlz_jobs = [(entry.name, os.path.join(usb_root, rel))
+                 for rel, entry in tree.items()
+                 if (rel.startswith("PIONEER/USBANLZ/") and rel.endswith(('.DAT', '.EXT', '.2EX'))
+                     and entry.is_file(follow_symlinks=False))]
+    if anlz_jobs:
+        with ThreadPoolExecutor(max_workers=min(8, len(anlz_jobs))) as executor:
+            futures = [(name, executor.submit(analyze_anlz, path)) for name, path in anlz_jobs]
+            for name, future in futures:
+                ok, report = future.result()
+                print(report)
+                results[name] = ok
     
     # Summary
     print(f"\n{'='*60}")